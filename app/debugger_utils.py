@@ -3,11 +3,14 @@ Debugger Utility Functions for EZ IDE
 Detects debugger capabilities and manages debugger selection
 """
 
+import json
 import os
 import subprocess
 import shutil
 from typing import Optional, Literal
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+
+from app.settings import get_cache_dir
 
 
 DebuggerType = Literal['native', 'repl', 'none']
@@ -169,6 +172,56 @@ def detect_debugger_support(ez_path: str) -> DebuggerCapabilities:
     )
 
 
+def detect_debugger_support_cached(ez_path: str) -> DebuggerCapabilities:
+    """
+    Same as detect_debugger_support, but remembers the result on disk
+    
+    Results are keyed on the interpreter path and its stat signature (mtime,
+    ctime, size and mode), so probing (which runs the interpreter twice) only
+    happens again after the interpreter is replaced, updated or re-permissioned.
+    A 'none' result is never cached, so a fixed interpreter is picked up at once.
+    
+    Args:
+        ez_path: Path to the EZ interpreter executable
+        
+    Returns:
+        DebuggerCapabilities object describing available features
+    """
+    try:
+        st = os.stat(ez_path)
+    except (OSError, ValueError):
+        # Nothing to key on; detection fails fast without running anything
+        return detect_debugger_support(ez_path)
+    
+    signature = [st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_mode]
+    cache_file = get_cache_dir() / 'debugger_caps.json'
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    
+    entry = cache.get(ez_path)
+    if entry and entry.get('signature') == signature:
+        try:
+            return DebuggerCapabilities(**entry['capabilities'])
+        except (KeyError, TypeError):
+            pass  # Stale format, probe again
+    
+    caps = detect_debugger_support(ez_path)
+    if caps.type == 'none':
+        return caps  # Not worth remembering; the interpreter may be fixed any time
+    
+    cache[ez_path] = {'signature': signature, 'capabilities': asdict(caps)}
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        print(f"Warning: Could not cache debugger capabilities: {e}")
+    
+    return caps
+
+
 def get_debugger_display_name(debugger_type: DebuggerType) -> str:
     """
     Get a human-readable name for the debugger type
@@ -312,9 +312,9 @@ class CodeEditor(QPlainTextEdit):
                 self.setPlainText(content)
                 self.document().setModified(False)
             except Exception as e:
-                QMessageBox.critical(None, "Error", f"Could not read file: {e}")
+                QMessageBox.critical(self.window(), "Error", f"Could not read file: {e}")
         except Exception as e:
-            QMessageBox.critical(None, "Error", f"Could not open file: {e}")
+            QMessageBox.critical(self.window(), "Error", f"Could not open file: {e}")
     
     def _setup_highlighter(self, filepath: str):
         """Set up syntax highlighter based on file extension"""
@@ -340,7 +340,7 @@ class CodeEditor(QPlainTextEdit):
             self.document().setModified(False)
             return True
         except Exception as e:
-            QMessageBox.critical(None, "Error", f"Could not save file: {e}")
+            QMessageBox.critical(self.window(), "Error", f"Could not save file: {e}")
             return False
     
     def keyPressEvent(self, event: QKeyEvent):
@@ -27,6 +27,15 @@ class GoDebugSession(QObject):
     session_ended = pyqtSignal()
     ready_for_step = pyqtSignal()               # Ready for next step
 
+    # QProcess error code -> user-facing message
+    _PROC_ERR = {
+        QProcess.ProcessError.FailedToStart: "Failed to start debugger",
+        QProcess.ProcessError.Crashed: "Debugger crashed",
+        QProcess.ProcessError.Timedout: "Debugger timed out",
+        QProcess.ProcessError.WriteError: "Error writing to debugger",
+        QProcess.ProcessError.ReadError: "Error reading from debugger",
+    }
+
     def __init__(self, settings_manager, parent=None):
         super().__init__(parent)
         self.settings_manager = settings_manager
@@ -35,6 +44,7 @@ class GoDebugSession(QObject):
         self.working_dir = ""
         self.current_line = 0
         self._supports_step = True
+        self._ended = False
 
     def supports_step(self) -> bool:
         """Returns True - native debugger always supports stepping"""
@@ -65,6 +75,7 @@ class GoDebugSession(QObject):
 
         self.filepath = filepath
         self.working_dir = working_dir or os.path.dirname(filepath)
+        self._ended = False
 
         # Create QProcess
         self.process = QProcess(self)
@@ -138,7 +149,13 @@ class GoDebugSession(QObject):
             if self.process.state() == QProcess.ProcessState.Running:
                 self.process.kill()
             self.process = None
-        self.session_ended.emit()
+        self._end_session()
+
+    def _end_session(self):
+        """Emit session_ended once per session, whichever path gets here first"""
+        if not self._ended:
+            self._ended = True
+            self.session_ended.emit()
 
     def _send_command(self, command: str, params: Dict):
         """Send a JSON-RPC command to the debugger"""
@@ -262,26 +279,18 @@ class GoDebugSession(QObject):
                 self.output_received.emit("\n✓ Program completed successfully")
             else:
                 self.error_received.emit(f"\n✗ Program exited with code {exit_code}")
-            self.session_ended.emit()
+            self._end_session()
 
         elif event == 'terminated':
             # Debug session terminated
-            self.session_ended.emit()
+            self._end_session()
 
     def _handle_finished(self, exit_code, exit_status):
         """Handle process finished"""
-        self.session_ended.emit()
+        self._end_session()
 
     def _handle_error(self, error):
         """Handle process error"""
-        error_messages = {
-            QProcess.ProcessError.FailedToStart: "Failed to start debugger",
-            QProcess.ProcessError.Crashed: "Debugger crashed",
-            QProcess.ProcessError.Timedout: "Debugger timed out",
-            QProcess.ProcessError.WriteError: "Error writing to debugger",
-            QProcess.ProcessError.ReadError: "Error reading from debugger",
-        }
-
-        msg = error_messages.get(error, f"Unknown error: {error}")
+        msg = self._PROC_ERR.get(error, f"Unknown error: {error}")
         self.error_received.emit(msg)
-        self.session_ended.emit()
+        self._end_session()
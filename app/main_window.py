@@ -4,9 +4,10 @@ The primary application window integrating all components
 """
 
 import os
+import stat
 import sys
-import subprocess
-import shutil
+from functools import lru_cache, partial
+from dataclasses import asdict
 from pathlib import Path
 from typing import Optional
 
@@ -15,12 +16,13 @@ from PyQt6.QtWidgets import (
     QFrame, QLabel, QToolBar, QStatusBar, QMenuBar, QMenu,
     QFileDialog, QInputDialog, QMessageBox, QDockWidget,
     QDialog, QFormLayout, QLineEdit, QComboBox, QSpinBox,
-    QCheckBox, QPushButton, QDialogButtonBox, QTabWidget,
-    QApplication
+    QCheckBox, QPushButton, QDialogButtonBox, QTabWidget
+)
+from PyQt6.QtCore import (
+    Qt, QSize, QUrl, pyqtSignal, QTimer, QSignalBlocker, QThreadPool, QProcess
 )
-from PyQt6.QtCore import Qt, QSize, pyqtSignal, QTimer
 from PyQt6.QtGui import (
-    QAction, QKeySequence, QIcon, QCloseEvent, QFont
+    QAction, QKeySequence, QIcon, QCloseEvent, QFont, QDesktopServices
 )
 
 from app.settings import SettingsManager
@@ -28,16 +30,164 @@ from app.themes import ThemeManager, Theme
 from app.file_browser import FileBrowserWidget
 from app.editor import EditorTabs
 from app.terminal import TerminalWidget
-from app.debug_session import DebugSession
-from app.go_debug_session import GoDebugSession
-from app.debug_panel import DebugPanel
-from app.debugger_utils import detect_debugger_support, get_debugger_display_name, get_debugger_icon
+
+
+# Menu tables: (text, shortcut, slot name[, attribute to store the action as]).
+# None inserts a separator.
+_StandardKey = QKeySequence.StandardKey
+
+FILE_MENU = (
+    ("&New File", _StandardKey.New, "_new_file"),
+    ("&Open...", _StandardKey.Open, "_open_file"),
+    ("Open &Folder...", "Ctrl+Shift+O", "_open_folder"),
+    None,
+    ("&Save", _StandardKey.Save, "_save_file"),
+    ("Save &As...", _StandardKey.SaveAs, "_save_file_as"),
+    ("Save A&ll", "Ctrl+Shift+S", "_save_all"),
+    None,
+    ("&Close", _StandardKey.Close, "_close_current_tab"),
+    ("Close All", "Ctrl+Shift+W", "_close_all_tabs"),
+)
+
+EXIT_MENU = (
+    ("E&xit", _StandardKey.Quit, "close"),
+)
+
+EDIT_MENU = (
+    ("&Undo", _StandardKey.Undo, "_undo"),
+    ("&Redo", _StandardKey.Redo, "_redo"),
+    None,
+    ("Cu&t", _StandardKey.Cut, "_cut"),
+    ("&Copy", _StandardKey.Copy, "_copy"),
+    ("&Paste", _StandardKey.Paste, "_paste"),
+    None,
+    ("Select &All", _StandardKey.SelectAll, "_select_all"),
+    None,
+    ("&Find...", _StandardKey.Find, "_find"),
+    ("&Go to Line...", "Ctrl+G", "_goto_line"),
+    None,
+    ("&Settings...", "Ctrl+,", "_show_settings"),
+)
+
+VIEW_MENU = (
+    ("Toggle &File Browser", "Ctrl+B", "_toggle_file_browser", "toggle_browser_action"),
+    ("Toggle &Terminal", "Ctrl+`", "_toggle_terminal", "toggle_terminal_action"),
+    ("Open &External Terminal", "Ctrl+Shift+T", "_open_external_terminal"),
+)
+
+ZOOM_MENU = (
+    ("Zoom &In", _StandardKey.ZoomIn, "_zoom_in"),
+    ("Zoom &Out", _StandardKey.ZoomOut, "_zoom_out"),
+    ("Reset Zoom", "Ctrl+0", "_zoom_reset"),
+)
+
+RUN_MENU = (
+    ("&Run Current File", "F5", "_run_current_file"),
+    None,
+    ("Select EZ &Interpreter...", None, "_select_ez_interpreter"),
+)
+
+DEBUG_MENU = (
+    ("&Start Debugging", "F5", "_debug_start", "debug_start_action"),
+    ("Step &Over", "F10", "_debug_step", "debug_step_action"),
+    ("S&top Debugging", "Shift+F5", "_debug_stop", "debug_stop_action"),
+    None,
+    ("Toggle Debug &Panel", "Ctrl+Shift+D", "_toggle_debug_panel", "toggle_debug_panel_action"),
+)
+
+HELP_MENU = (
+    ("&About EZ IDE", None, "_show_about"),
+    ("EZ &Documentation", None, "_open_docs"),
+)
+
+# External terminal emulators to try on Linux, in order of preference
+LINUX_TERMINALS = (
+    'gnome-terminal',
+    'konsole', 
+    'xfce4-terminal',
+    'mate-terminal',
+    'terminator',
+    'xterm',
+    'urxvt',
+    'rxvt',
+    'x-terminal-emulator'
+)
+
+
+# Terminal emulator found by _detect_linux_terminal (None until one is found)
+_linux_terminal: Optional[str] = None
+
+
+def _detect_linux_terminal() -> Optional[str]:
+    """
+    Find the first available terminal emulator
+    
+    A found terminal is remembered for the rest of the run; a miss is not,
+    so a terminal installed after the warning is picked up on the next try.
+    """
+    global _linux_terminal
+    if _linux_terminal is None:
+        import shutil
+        
+        for term in LINUX_TERMINALS:
+            if shutil.which(term):
+                _linux_terminal = term
+                break
+    return _linux_terminal
+
+
+def _is_executable_file(path: str) -> bool:
+    """Check for a regular file with an execute bit using a single stat()"""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
+
+@lru_cache(maxsize=512)
+def _line_status(line: int) -> str:
+    """Debug panel status text for a line, reused while stepping"""
+    return f"Line {line}"
+
+
+@lru_cache(maxsize=512)
+def _cursor_status(line: int, column: int) -> str:
+    """Status bar text for a cursor position"""
+    return f"Ln {line}, Col {column}"
+
+
+# Terminal position -> (splitter orientation, editor size, WindowSettings field
+# holding the terminal size). Unknown positions use the bottom layout.
+TERMINAL_LAYOUTS = {
+    "bottom": (Qt.Orientation.Vertical, 600, "terminal_height"),
+    "right": (Qt.Orientation.Horizontal, 800, "terminal_width"),
+}
+
+# Toolbar font with emoji fallbacks, shared by every toolbar
+EMOJI_TOOLBAR_FONT = QFont()
+EMOJI_TOOLBAR_FONT.setFamilies(["Sans", "Noto Color Emoji", "Segoe UI Emoji", "Apple Color Emoji"])
+
+# Parsed shortcuts, keyed by their table value. Filled on first use because
+# resolving a StandardKey needs the QApplication to exist.
+_KEY_SEQUENCES = {}
+
+
+def _key_sequence(shortcut) -> QKeySequence:
+    """Get the shared QKeySequence for a shortcut string or StandardKey"""
+    sequence = _KEY_SEQUENCES.get(shortcut)
+    if sequence is None:
+        sequence = _KEY_SEQUENCES[shortcut] = QKeySequence(shortcut)
+    return sequence
 
 
 class SettingsDialog(QDialog):
     """Settings dialog for configuring the IDE"""
     
-    settings_applied = pyqtSignal()  # Emitted when settings are applied
+    settings_applied = pyqtSignal(set)  # Emitted with the changed setting groups
+    
+    # Setting groups that can be reported as changed by settings_applied
+    SETTING_GROUPS = frozenset({"theme", "editor", "terminal_font", "terminal_position"})
     
     def __init__(self, settings: SettingsManager, theme_manager: ThemeManager, parent=None):
         super().__init__(parent)
@@ -52,54 +202,81 @@ class SettingsDialog(QDialog):
     def _setup_ui(self):
         layout = QVBoxLayout(self)
         
-        # Tab widget for different settings categories
-        tabs = QTabWidget()
+        # Tab widget for different settings categories. Each tab starts as an
+        # empty placeholder and is populated the first time it is shown.
+        self.tabs = QTabWidget()
+        self._tab_builders = {}
+        for title, builder in (
+            ("Editor", self._build_editor_tab),
+            ("Appearance", self._build_appearance_tab),
+            ("Terminal", self._build_terminal_tab),
+        ):
+            index = self.tabs.addTab(QWidget(), title)
+            self._tab_builders[index] = builder
         
-        # Editor settings
-        editor_tab = QWidget()
-        editor_layout = QFormLayout(editor_tab)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tabs.currentIndex())
         
-        self.font_family = QLineEdit(self.settings.settings.editor.font_family)
+        layout.addWidget(self.tabs)
+        
+        # Dialog buttons
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok |
+            QDialogButtonBox.StandardButton.Cancel |
+            QDialogButtonBox.StandardButton.Apply
+        )
+        buttons.accepted.connect(self._save_and_close)
+        buttons.rejected.connect(self.reject)
+        buttons.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self._apply)
+        
+        layout.addWidget(buttons)
+    
+    def _ensure_tab_built(self, index: int):
+        """Populate a settings tab the first time it becomes current"""
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder(QFormLayout(self.tabs.widget(index)))
+    
+    def _build_editor_tab(self, editor_layout: QFormLayout):
+        """Create the Editor settings controls"""
+        es = self.settings.settings.editor
+        self.font_family = QLineEdit(es.font_family)
         editor_layout.addRow("Font Family:", self.font_family)
         
         self.font_size = QSpinBox()
         self.font_size.setRange(6, 48)
-        self.font_size.setValue(self.settings.settings.editor.font_size)
+        self.font_size.setValue(es.font_size)
         editor_layout.addRow("Font Size:", self.font_size)
         
         self.tab_width = QSpinBox()
         self.tab_width.setRange(1, 8)
-        self.tab_width.setValue(self.settings.settings.editor.tab_width)
+        self.tab_width.setValue(es.tab_width)
         editor_layout.addRow("Tab Width:", self.tab_width)
         
         self.use_spaces = QCheckBox("Use spaces instead of tabs")
-        self.use_spaces.setChecked(self.settings.settings.editor.use_spaces)
+        self.use_spaces.setChecked(es.use_spaces)
         editor_layout.addRow("", self.use_spaces)
         
         self.show_line_numbers = QCheckBox("Show line numbers")
-        self.show_line_numbers.setChecked(self.settings.settings.editor.show_line_numbers)
+        self.show_line_numbers.setChecked(es.show_line_numbers)
         editor_layout.addRow("", self.show_line_numbers)
         
         self.word_wrap = QCheckBox("Word wrap")
-        self.word_wrap.setChecked(self.settings.settings.editor.word_wrap)
+        self.word_wrap.setChecked(es.word_wrap)
         editor_layout.addRow("", self.word_wrap)
         
         self.highlight_line = QCheckBox("Highlight current line")
-        self.highlight_line.setChecked(self.settings.settings.editor.highlight_current_line)
+        self.highlight_line.setChecked(es.highlight_current_line)
         editor_layout.addRow("", self.highlight_line)
         
         self.bracket_matching = QCheckBox("Auto-close brackets")
-        self.bracket_matching.setChecked(self.settings.settings.editor.bracket_matching)
+        self.bracket_matching.setChecked(es.bracket_matching)
         editor_layout.addRow("", self.bracket_matching)
-        
-        tabs.addTab(editor_tab, "Editor")
-        
-        # Theme settings
-        theme_tab = QWidget()
-        theme_layout = QFormLayout(theme_tab)
-        
+    
+    def _build_appearance_tab(self, theme_layout: QFormLayout):
+        """Create the Appearance settings controls"""
         self.theme_combo = QComboBox()
-        themes = self.theme_manager.get_available_themes()
+        self._themes = themes = self.theme_manager.get_available_themes()
         self.theme_combo.addItems([t.title() for t in themes])
         current_theme = self.settings.settings.theme.current_theme
         for i, t in enumerate(themes):
@@ -107,69 +284,68 @@ class SettingsDialog(QDialog):
                 self.theme_combo.setCurrentIndex(i)
                 break
         theme_layout.addRow("Theme:", self.theme_combo)
-        
-        tabs.addTab(theme_tab, "Appearance")
-        
-        # Terminal settings
-        terminal_tab = QWidget()
-        terminal_layout = QFormLayout(terminal_tab)
-        
-        self.terminal_font = QLineEdit(self.settings.settings.terminal.font_family)
+    
+    def _build_terminal_tab(self, terminal_layout: QFormLayout):
+        """Create the Terminal settings controls"""
+        ts = self.settings.settings.terminal
+        self.terminal_font = QLineEdit(ts.font_family)
         terminal_layout.addRow("Font Family:", self.terminal_font)
         
         self.terminal_font_size = QSpinBox()
         self.terminal_font_size.setRange(6, 48)
-        self.terminal_font_size.setValue(self.settings.settings.terminal.font_size)
+        self.terminal_font_size.setValue(ts.font_size)
         terminal_layout.addRow("Font Size:", self.terminal_font_size)
         
         self.terminal_position = QComboBox()
         self.terminal_position.addItems(["Bottom", "Right"])
-        if self.settings.settings.terminal.position == "right":
+        if ts.position == "right":
             self.terminal_position.setCurrentIndex(1)
         terminal_layout.addRow("Position:", self.terminal_position)
-        
-        tabs.addTab(terminal_tab, "Terminal")
-        
-        layout.addWidget(tabs)
-        
-        # Dialog buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok |
-            QDialogButtonBox.StandardButton.Cancel |
-            QDialogButtonBox.StandardButton.Apply
-        )
-        buttons.accepted.connect(self._save_and_close)
-        buttons.rejected.connect(self.reject)
-        buttons.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self._apply)
-        
-        layout.addWidget(buttons)
     
     def _apply(self):
         """Apply settings without closing"""
-        # Editor settings
-        self.settings.settings.editor.font_family = self.font_family.text()
-        self.settings.settings.editor.font_size = self.font_size.value()
-        self.settings.settings.editor.tab_width = self.tab_width.value()
-        self.settings.settings.editor.use_spaces = self.use_spaces.isChecked()
-        self.settings.settings.editor.show_line_numbers = self.show_line_numbers.isChecked()
-        self.settings.settings.editor.word_wrap = self.word_wrap.isChecked()
-        self.settings.settings.editor.highlight_current_line = self.highlight_line.isChecked()
-        self.settings.settings.editor.bracket_matching = self.bracket_matching.isChecked()
-        
-        # Theme
-        themes = self.theme_manager.get_available_themes()
-        theme_name = themes[self.theme_combo.currentIndex()]
-        self.theme_manager.set_theme(theme_name)
-        
-        # Terminal settings
-        self.settings.settings.terminal.font_family = self.terminal_font.text()
-        self.settings.settings.terminal.font_size = self.terminal_font_size.value()
-        self.settings.settings.terminal.position = self.terminal_position.currentText().lower()
+        changed = set()
+        
+        # Tabs that were never opened keep their current settings
+        if hasattr(self, 'font_family'):
+            # Editor settings
+            es = self.settings.settings.editor
+            old_editor = asdict(es)
+            es.font_family = self.font_family.text()
+            es.font_size = self.font_size.value()
+            es.tab_width = self.tab_width.value()
+            es.use_spaces = self.use_spaces.isChecked()
+            es.show_line_numbers = self.show_line_numbers.isChecked()
+            es.word_wrap = self.word_wrap.isChecked()
+            es.highlight_current_line = self.highlight_line.isChecked()
+            es.bracket_matching = self.bracket_matching.isChecked()
+            if asdict(es) != old_editor:
+                changed.add("editor")
+        
+        if hasattr(self, 'theme_combo'):
+            # Theme
+            theme_name = self._themes[self.theme_combo.currentIndex()]
+            if theme_name != self.settings.settings.theme.current_theme:
+                self.theme_manager.set_theme(theme_name)
+                changed.add("theme")
+        
+        if hasattr(self, 'terminal_font'):
+            # Terminal settings
+            ts = self.settings.settings.terminal
+            old_font = (ts.font_family, ts.font_size)
+            old_position = ts.position
+            ts.font_family = self.terminal_font.text()
+            ts.font_size = self.terminal_font_size.value()
+            ts.position = self.terminal_position.currentText().lower()
+            if (ts.font_family, ts.font_size) != old_font:
+                changed.add("terminal_font")
+            if ts.position != old_position:
+                changed.add("terminal_position")
         
         self.settings.save()
         
         # Notify parent to refresh UI
-        self.settings_applied.emit()
+        self.settings_applied.emit(changed)
     
     def _save_and_close(self):
         """Save settings and close dialog"""
@@ -214,7 +390,23 @@ class EZIDEMainWindow(QMainWindow):
         self.settings = settings
         self.theme_manager = theme_manager
         
+        # Existing recent paths the Recent Files submenu was last built from
+        self._recent_menu_fingerprint = None
+        # Editor in the current tab, kept in sync with EditorTabs.currentChanged
+        self._current_editor = None
+        
+        # UI toggles mark settings dirty; one save follows once they settle
+        self._settings_dirty = False
+        self._settings_flush_timer = QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.setInterval(250)
+        self._settings_flush_timer.timeout.connect(self._flush_settings)
+        # Settings are written on a single worker thread so writes never overlap
+        self._settings_save_pool = QThreadPool(self)
+        self._settings_save_pool.setMaxThreadCount(1)
+        
         self.setWindowTitle("EZ IDE")
+        self._apply_stylesheet()
         self._restore_window_state()
         
         self._setup_ui()
@@ -225,6 +417,10 @@ class EZIDEMainWindow(QMainWindow):
         self._setup_connections()
         self._setup_debug()
     
+    def _apply_stylesheet(self):
+        """Style this window's widget tree (and its dialogs) with the current theme"""
+        self.setStyleSheet(self.theme_manager.get_current_stylesheet())
+    
     def _restore_window_state(self):
         """Restore window size and state"""
         ws = self.settings.settings.window
@@ -234,6 +430,7 @@ class EZIDEMainWindow(QMainWindow):
     
     def _setup_ui(self):
         """Set up the main UI"""
+        ws = self.settings.settings.window
         central = QWidget()
         self.setCentralWidget(central)
         
@@ -258,18 +455,11 @@ class EZIDEMainWindow(QMainWindow):
         self.editor_tabs = EditorTabs(self.settings, self.theme_manager)
         self.editor_terminal_splitter.addWidget(self.editor_tabs)
         
-        # Terminal
-        self.terminal = TerminalWidget(
-            self.settings, 
-            self.theme_manager.get_current_theme()
-        )
-        self.terminal.setMinimumHeight(100)
-        
-        # Terminal container
+        # Terminal container (the terminal itself is created on first use)
+        self.terminal: Optional[TerminalWidget] = None
         self.terminal_container = QFrame()
         terminal_layout = QVBoxLayout(self.terminal_container)
         terminal_layout.setContentsMargins(0, 0, 0, 0)
-        terminal_layout.addWidget(self.terminal)
         
         self.editor_terminal_splitter.addWidget(self.terminal_container)
         
@@ -279,175 +469,107 @@ class EZIDEMainWindow(QMainWindow):
         self.main_splitter.addWidget(self.editor_terminal_splitter)
         
         # Set splitter sizes from settings
-        ws = self.settings.settings.window
         self.main_splitter.setSizes([ws.file_browser_width, 1000])
         
         # Apply visibility settings
         if not ws.file_browser_visible:
             self.file_browser.hide()
-        if not self.settings.settings.terminal.visible:
+        if self.settings.settings.terminal.visible:
+            self._ensure_terminal()
+        else:
             self.terminal_container.hide()
         
         main_layout.addWidget(self.main_splitter)
         
-        # Debug panel (initially hidden)
-        self.debug_panel = DebugPanel(self.theme_manager.get_current_theme())
-        self.debug_panel.setMinimumWidth(250)
-        self.debug_panel.setMaximumWidth(400)
-        self.debug_panel.hide()
-        self.main_splitter.addWidget(self.debug_panel)
+        # Debug panel is created the first time debugging is used
+        self.debug_panel = None
         
         # Handle terminal position (bottom vs right)
         self._update_terminal_position()
     
+    def _ensure_terminal(self) -> TerminalWidget:
+        """Create the terminal widget on first use"""
+        if self.terminal is None:
+            self.terminal = TerminalWidget(
+                self.settings, 
+                self.theme_manager.get_current_theme()
+            )
+            self.terminal.setMinimumHeight(100)
+            self.terminal_container.layout().addWidget(self.terminal)
+        return self.terminal
+    
+    def _ensure_debug_panel(self):
+        """Create the debug panel on first use (initially hidden)"""
+        if self.debug_panel is None:
+            from app.debug_panel import DebugPanel
+            
+            self.debug_panel = DebugPanel(self.theme_manager.get_current_theme())
+            self.debug_panel.setMinimumWidth(250)
+            self.debug_panel.setMaximumWidth(400)
+            self.debug_panel.hide()
+            self.main_splitter.addWidget(self.debug_panel)
+            
+            # Connect debug panel signals
+            self.debug_panel.start_requested.connect(self._debug_start)
+            self.debug_panel.step_requested.connect(self._debug_step)
+            self.debug_panel.stop_requested.connect(self._debug_stop)
+            
+            # Set debugger type indicator in panel
+            self.debug_panel.set_debugger_type(self._debugger_icon, self._debugger_name)
+        return self.debug_panel
+    
     def _update_terminal_position(self):
         """Update terminal position based on settings"""
         pos = self.settings.settings.terminal.position
+        orientation, editor_size, size_setting = TERMINAL_LAYOUTS.get(
+            pos, TERMINAL_LAYOUTS["bottom"]
+        )
         
         # Remove terminal from current parent
         self.terminal_container.setParent(None)
         
-        if pos == "right":
-            # Add terminal to main horizontal splitter
-            self.editor_terminal_splitter.setOrientation(Qt.Orientation.Horizontal)
-        else:
-            # Keep terminal below editor (vertical)
-            self.editor_terminal_splitter.setOrientation(Qt.Orientation.Vertical)
-        
+        self.editor_terminal_splitter.setOrientation(orientation)
         self.editor_terminal_splitter.addWidget(self.terminal_container)
         
         # Update sizes
-        if pos == "right":
-            self.editor_terminal_splitter.setSizes([
-                800, 
-                self.settings.settings.window.terminal_width
-            ])
-        else:
-            self.editor_terminal_splitter.setSizes([
-                600, 
-                self.settings.settings.window.terminal_height
-            ])
+        self.editor_terminal_splitter.setSizes([
+            editor_size,
+            getattr(self.settings.settings.window, size_setting)
+        ])
     
     def _setup_menus(self):
         """Set up the menu bar"""
+        ws = self.settings.settings.window
+        ts = self.settings.settings.terminal
         menubar = self.menuBar()
         
         # File menu
         file_menu = menubar.addMenu("&File")
-        
-        new_action = file_menu.addAction("&New File")
-        new_action.setShortcut(QKeySequence.StandardKey.New)
-        new_action.triggered.connect(self._new_file)
-        
-        open_action = file_menu.addAction("&Open...")
-        open_action.setShortcut(QKeySequence.StandardKey.Open)
-        open_action.triggered.connect(self._open_file)
-        
-        open_folder_action = file_menu.addAction("Open &Folder...")
-        open_folder_action.setShortcut("Ctrl+Shift+O")
-        open_folder_action.triggered.connect(self._open_folder)
-        
-        file_menu.addSeparator()
-        
-        save_action = file_menu.addAction("&Save")
-        save_action.setShortcut(QKeySequence.StandardKey.Save)
-        save_action.triggered.connect(self._save_file)
-        
-        save_as_action = file_menu.addAction("Save &As...")
-        save_as_action.setShortcut(QKeySequence.StandardKey.SaveAs)
-        save_as_action.triggered.connect(self._save_file_as)
-        
-        save_all_action = file_menu.addAction("Save A&ll")
-        save_all_action.setShortcut("Ctrl+Shift+S")
-        save_all_action.triggered.connect(self.editor_tabs.save_all)
-        
-        file_menu.addSeparator()
-        
-        close_action = file_menu.addAction("&Close")
-        close_action.setShortcut(QKeySequence.StandardKey.Close)
-        close_action.triggered.connect(self._close_current_tab)
-        
-        close_all_action = file_menu.addAction("Close All")
-        close_all_action.setShortcut("Ctrl+Shift+W")
-        close_all_action.triggered.connect(self.editor_tabs.close_all_tabs)
+        self._add_menu_actions(file_menu, FILE_MENU)
         
         file_menu.addSeparator()
         
         # Recent files submenu
         self.recent_menu = file_menu.addMenu("Recent Files")
+        self.recent_menu.aboutToShow.connect(self._update_recent_files_menu)
         self._update_recent_files_menu()
         
         file_menu.addSeparator()
         
-        exit_action = file_menu.addAction("E&xit")
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.triggered.connect(self.close)
+        self._add_menu_actions(file_menu, EXIT_MENU)
         
         # Edit menu
         edit_menu = menubar.addMenu("&Edit")
-        
-        undo_action = edit_menu.addAction("&Undo")
-        undo_action.setShortcut(QKeySequence.StandardKey.Undo)
-        undo_action.triggered.connect(self._undo)
-        
-        redo_action = edit_menu.addAction("&Redo")
-        redo_action.setShortcut(QKeySequence.StandardKey.Redo)
-        redo_action.triggered.connect(self._redo)
-        
-        edit_menu.addSeparator()
-        
-        cut_action = edit_menu.addAction("Cu&t")
-        cut_action.setShortcut(QKeySequence.StandardKey.Cut)
-        cut_action.triggered.connect(self._cut)
-        
-        copy_action = edit_menu.addAction("&Copy")
-        copy_action.setShortcut(QKeySequence.StandardKey.Copy)
-        copy_action.triggered.connect(self._copy)
-        
-        paste_action = edit_menu.addAction("&Paste")
-        paste_action.setShortcut(QKeySequence.StandardKey.Paste)
-        paste_action.triggered.connect(self._paste)
-        
-        edit_menu.addSeparator()
-        
-        select_all_action = edit_menu.addAction("Select &All")
-        select_all_action.setShortcut(QKeySequence.StandardKey.SelectAll)
-        select_all_action.triggered.connect(self._select_all)
-        
-        edit_menu.addSeparator()
-        
-        find_action = edit_menu.addAction("&Find...")
-        find_action.setShortcut(QKeySequence.StandardKey.Find)
-        find_action.triggered.connect(self._find)
-        
-        goto_action = edit_menu.addAction("&Go to Line...")
-        goto_action.setShortcut("Ctrl+G")
-        goto_action.triggered.connect(self._goto_line)
-        
-        edit_menu.addSeparator()
-        
-        settings_action = edit_menu.addAction("&Settings...")
-        settings_action.setShortcut("Ctrl+,")
-        settings_action.triggered.connect(self._show_settings)
+        self._add_menu_actions(edit_menu, EDIT_MENU)
         
         # View menu
         view_menu = menubar.addMenu("&View")
+        self._add_menu_actions(view_menu, VIEW_MENU)
         
-        self.toggle_browser_action = view_menu.addAction("Toggle &File Browser")
-        self.toggle_browser_action.setShortcut("Ctrl+B")
         self.toggle_browser_action.setCheckable(True)
-        self.toggle_browser_action.setChecked(self.settings.settings.window.file_browser_visible)
-        self.toggle_browser_action.triggered.connect(self._toggle_file_browser)
-        
-        self.toggle_terminal_action = view_menu.addAction("Toggle &Terminal")
-        self.toggle_terminal_action.setShortcut("Ctrl+`")
+        self.toggle_browser_action.setChecked(ws.file_browser_visible)
         self.toggle_terminal_action.setCheckable(True)
-        self.toggle_terminal_action.setChecked(self.settings.settings.terminal.visible)
-        self.toggle_terminal_action.triggered.connect(self._toggle_terminal)
-        
-        open_external_term_action = view_menu.addAction("Open &External Terminal")
-        open_external_term_action.setShortcut("Ctrl+Shift+T")
-        open_external_term_action.triggered.connect(self._open_external_terminal)
+        self.toggle_terminal_action.setChecked(ts.visible)
         
         view_menu.addSeparator()
         
@@ -455,98 +577,76 @@ class EZIDEMainWindow(QMainWindow):
         
         terminal_bottom = terminal_position_menu.addAction("Bottom")
         terminal_bottom.setCheckable(True)
-        terminal_bottom.setChecked(self.settings.settings.terminal.position == "bottom")
-        terminal_bottom.triggered.connect(lambda: self._set_terminal_position("bottom"))
+        terminal_bottom.setChecked(ts.position == "bottom")
+        terminal_bottom.triggered.connect(partial(self._set_terminal_position, "bottom"))
         
         terminal_right = terminal_position_menu.addAction("Right")
         terminal_right.setCheckable(True)
-        terminal_right.setChecked(self.settings.settings.terminal.position == "right")
-        terminal_right.triggered.connect(lambda: self._set_terminal_position("right"))
+        terminal_right.setChecked(ts.position == "right")
+        terminal_right.triggered.connect(partial(self._set_terminal_position, "right"))
         
-        self.terminal_position_actions = [terminal_bottom, terminal_right]
+        self.terminal_position_actions = {"bottom": terminal_bottom, "right": terminal_right}
         
         view_menu.addSeparator()
         
-        zoom_in_action = view_menu.addAction("Zoom &In")
-        zoom_in_action.setShortcut(QKeySequence.StandardKey.ZoomIn)
-        zoom_in_action.triggered.connect(self._zoom_in)
-        
-        zoom_out_action = view_menu.addAction("Zoom &Out")
-        zoom_out_action.setShortcut(QKeySequence.StandardKey.ZoomOut)
-        zoom_out_action.triggered.connect(self._zoom_out)
-        
-        zoom_reset_action = view_menu.addAction("Reset Zoom")
-        zoom_reset_action.setShortcut("Ctrl+0")
-        zoom_reset_action.triggered.connect(self._zoom_reset)
+        self._add_menu_actions(view_menu, ZOOM_MENU)
         
         view_menu.addSeparator()
         
         # Theme submenu
         theme_menu = view_menu.addMenu("&Theme")
-        self.theme_actions = []
+        self._theme_action_by_name = {}
+        current_theme = self.settings.settings.theme.current_theme
         for theme_name in self.theme_manager.get_available_themes():
             action = theme_menu.addAction(theme_name.title())
             action.setCheckable(True)
-            action.setChecked(theme_name == self.settings.settings.theme.current_theme)
-            action.triggered.connect(lambda checked, t=theme_name: self._set_theme(t))
-            self.theme_actions.append((theme_name, action))
+            action.setChecked(theme_name == current_theme)
+            action.triggered.connect(partial(self._set_theme, theme_name))
+            self._theme_action_by_name[theme_name] = action
+        self._checked_theme_action = self._theme_action_by_name.get(current_theme)
         
         # Run menu
         run_menu = menubar.addMenu("&Run")
-        
-        run_file_action = run_menu.addAction("&Run Current File")
-        run_file_action.setShortcut("F5")
-        run_file_action.triggered.connect(self._run_current_file)
-        
-        run_menu.addSeparator()
-        
-        select_interpreter_action = run_menu.addAction("Select EZ &Interpreter...")
-        select_interpreter_action.triggered.connect(self._select_ez_interpreter)
+        self._add_menu_actions(run_menu, RUN_MENU)
         
         # Debug menu
         debug_menu = menubar.addMenu("&Debug")
+        self._add_menu_actions(debug_menu, DEBUG_MENU)
         
-        self.debug_start_action = debug_menu.addAction("&Start Debugging")
-        self.debug_start_action.setShortcut("F5")
-        self.debug_start_action.triggered.connect(self._debug_start)
-        
-        self.debug_step_action = debug_menu.addAction("Step &Over")
-        self.debug_step_action.setShortcut("F10")
         self.debug_step_action.setEnabled(False)
-        self.debug_step_action.triggered.connect(self._debug_step)
-        
-        self.debug_stop_action = debug_menu.addAction("S&top Debugging")
-        self.debug_stop_action.setShortcut("Shift+F5")
         self.debug_stop_action.setEnabled(False)
-        self.debug_stop_action.triggered.connect(self._debug_stop)
-        
-        debug_menu.addSeparator()
-        
-        self.toggle_debug_panel_action = debug_menu.addAction("Toggle Debug &Panel")
-        self.toggle_debug_panel_action.setShortcut("Ctrl+Shift+D")
         self.toggle_debug_panel_action.setCheckable(True)
-        self.toggle_debug_panel_action.triggered.connect(self._toggle_debug_panel)
         
         # Help menu
         help_menu = menubar.addMenu("&Help")
-        
-        about_action = help_menu.addAction("&About EZ IDE")
-        about_action.triggered.connect(self._show_about)
-        
-        docs_action = help_menu.addAction("EZ &Documentation")
-        docs_action.triggered.connect(self._open_docs)
+        self._add_menu_actions(help_menu, HELP_MENU)
+    
+    def _add_menu_actions(self, menu: QMenu, table: tuple):
+        """Add the actions described by a menu table to a menu"""
+        for entry in table:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            
+            text, shortcut, slot_name, *attr_name = entry
+            action = menu.addAction(text)
+            if shortcut:
+                action.setShortcut(_key_sequence(shortcut))
+            action.triggered.connect(getattr(self, slot_name))
+            if attr_name:
+                setattr(self, attr_name[0], action)
     
     def _setup_toolbar(self):
         """Set up the toolbar"""
+        ws = self.settings.settings.window
+        ts = self.settings.settings.terminal
         toolbar = QToolBar("Main Toolbar")
         toolbar.setMovable(False)
         toolbar.setIconSize(QSize(20, 20))
         self.addToolBar(toolbar)
         
         # Set font with emoji support
-        toolbar_font = QFont()
-        toolbar_font.setFamilies(["Sans", "Noto Color Emoji", "Segoe UI Emoji", "Apple Color Emoji"])
-        toolbar.setFont(toolbar_font)
+        toolbar.setFont(EMOJI_TOOLBAR_FONT)
         
         # New file
         new_btn = toolbar.addAction("📄 New")
@@ -576,7 +676,7 @@ class EZIDEMainWindow(QMainWindow):
         browser_btn = toolbar.addAction("📁 Browser")
         browser_btn.setToolTip("Toggle File Browser (Ctrl+B)")
         browser_btn.setCheckable(True)
-        browser_btn.setChecked(self.settings.settings.window.file_browser_visible)
+        browser_btn.setChecked(ws.file_browser_visible)
         browser_btn.triggered.connect(self._toggle_file_browser)
         self.browser_toolbar_btn = browser_btn
         
@@ -584,7 +684,7 @@ class EZIDEMainWindow(QMainWindow):
         terminal_btn = toolbar.addAction("💻 Terminal")
         terminal_btn.setToolTip("Toggle Terminal (Ctrl+`)")
         terminal_btn.setCheckable(True)
-        terminal_btn.setChecked(self.settings.settings.terminal.visible)
+        terminal_btn.setChecked(ts.visible)
         terminal_btn.triggered.connect(self._toggle_terminal)
         self.terminal_toolbar_btn = terminal_btn
         
@@ -615,6 +715,15 @@ class EZIDEMainWindow(QMainWindow):
         self.cursor_label = QLabel("Ln 1, Col 1")
         self.statusbar.addPermanentWidget(self.cursor_label)
         
+        # Cursor moves are coalesced so the label repaints at most once per
+        # frame (~60 times a second)
+        self._pending_cursor = (1, 1)
+        self._shown_cursor = (1, 1)
+        self._cursor_timer = QTimer(self)
+        self._cursor_timer.setSingleShot(True)
+        self._cursor_timer.setInterval(16)  # At most one label update per frame
+        self._cursor_timer.timeout.connect(self._flush_cursor_update)
+        
         # Encoding
         self.encoding_label = QLabel("UTF-8")
         self.statusbar.addPermanentWidget(self.encoding_label)
@@ -629,19 +738,26 @@ class EZIDEMainWindow(QMainWindow):
         self.file_browser.file_opened.connect(self.editor_tabs.open_file)
         
         # Editor tabs
+        self.editor_tabs.currentChanged.connect(self._on_current_tab_changed)
         self.editor_tabs.current_file_changed.connect(self._on_current_file_changed)
         self.editor_tabs.cursor_position_changed.connect(self._on_cursor_position_changed)
         self.editor_tabs.file_saved.connect(lambda f: self.statusbar.showMessage(f"Saved: {f}", 3000))
     
     def _update_recent_files_menu(self):
         """Update the recent files submenu"""
+        # Existence is checked on every refresh, so deleted files drop out;
+        # only the menu rebuild is skipped when nothing changed
+        existing = self._existing_recent_files(self.settings.settings.recent_files[:10])
+        fingerprint = tuple(existing)
+        if fingerprint == self._recent_menu_fingerprint:
+            return
+        
         self.recent_menu.clear()
         
-        for filepath in self.settings.settings.recent_files[:10]:
-            if os.path.exists(filepath):
-                action = self.recent_menu.addAction(os.path.basename(filepath))
-                action.setToolTip(filepath)
-                action.triggered.connect(lambda checked, f=filepath: self.editor_tabs.open_file(f))
+        for filepath in existing:
+            action = self.recent_menu.addAction(os.path.basename(filepath))
+            action.setToolTip(filepath)
+            action.triggered.connect(partial(self.editor_tabs.open_file, filepath))
         
         if self.recent_menu.isEmpty():
             self.recent_menu.addAction("No recent files").setEnabled(False)
@@ -649,11 +765,35 @@ class EZIDEMainWindow(QMainWindow):
             self.recent_menu.addSeparator()
             clear_action = self.recent_menu.addAction("Clear Recent Files")
             clear_action.triggered.connect(self._clear_recent_files)
+        
+        self._recent_menu_fingerprint = fingerprint
+    
+    def _existing_recent_files(self, recent: list) -> list:
+        """Return the recent files that still exist, listing each parent directory once"""
+        listings = {}
+        for directory in {os.path.dirname(f) for f in recent}:
+            try:
+                with os.scandir(directory or os.curdir) as entries:
+                    # Broken symlinks don't count, matching os.path.exists
+                    listings[directory] = {
+                        entry.name for entry in entries
+                        if not entry.is_symlink() or os.path.exists(entry.path)
+                    }
+            except OSError:
+                listings[directory] = set()
+        
+        # Names missing from the listing get a real check, which also covers a
+        # stored path whose case differs on a case-insensitive filesystem
+        return [
+            f for f in recent
+            if os.path.basename(f) in listings[os.path.dirname(f)] or os.path.exists(f)
+        ]
     
     def _clear_recent_files(self):
         """Clear recent files list"""
+        self._recent_menu_fingerprint = None
         self.settings.settings.recent_files = []
-        self.settings.save()
+        self._mark_settings_dirty()
         self._update_recent_files_menu()
     
     # File operations
@@ -683,46 +823,55 @@ class EZIDEMainWindow(QMainWindow):
     def _save_file_as(self):
         self.editor_tabs.save_current_as()
     
+    def _save_all(self):
+        self.editor_tabs.save_all()
+    
     def _close_current_tab(self):
         index = self.editor_tabs.currentIndex()
         if index >= 0:
             self.editor_tabs.close_tab(index)
     
+    def _close_all_tabs(self):
+        self.editor_tabs.close_all_tabs()
+    
+    def _on_current_tab_changed(self, index: int):
+        self._current_editor = self.editor_tabs.get_current_editor()
+    
     # Edit operations
     def _undo(self):
-        editor = self.editor_tabs.get_current_editor()
-        if editor:
+        editor = self._current_editor
+        if editor is not None:
             editor.undo()
     
     def _redo(self):
-        editor = self.editor_tabs.get_current_editor()
-        if editor:
+        editor = self._current_editor
+        if editor is not None:
             editor.redo()
     
     def _cut(self):
-        editor = self.editor_tabs.get_current_editor()
-        if editor:
+        editor = self._current_editor
+        if editor is not None:
             editor.cut()
     
     def _copy(self):
-        editor = self.editor_tabs.get_current_editor()
-        if editor:
+        editor = self._current_editor
+        if editor is not None:
             editor.copy()
     
     def _paste(self):
-        editor = self.editor_tabs.get_current_editor()
-        if editor:
+        editor = self._current_editor
+        if editor is not None:
             editor.paste()
     
     def _select_all(self):
-        editor = self.editor_tabs.get_current_editor()
-        if editor:
+        editor = self._current_editor
+        if editor is not None:
             editor.selectAll()
     
     def _find(self):
         # Simple find implementation - could be enhanced
-        editor = self.editor_tabs.get_current_editor()
-        if not editor:
+        editor = self._current_editor
+        if editor is None:
             return
         
         text, ok = QInputDialog.getText(self, "Find", "Search for:")
@@ -741,8 +890,8 @@ class EZIDEMainWindow(QMainWindow):
                     self.statusbar.showMessage(f"'{text}' not found", 3000)
     
     def _goto_line(self):
-        editor = self.editor_tabs.get_current_editor()
-        if not editor:
+        editor = self._current_editor
+        if editor is None:
             return
         
         max_line = editor.blockCount()
@@ -752,66 +901,92 @@ class EZIDEMainWindow(QMainWindow):
     
     def _show_settings(self):
         dialog = SettingsDialog(self.settings, self.theme_manager, self)
+        # OK applies through settings_applied as well, so no refresh is needed here
         dialog.settings_applied.connect(self._apply_settings)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            # Also refresh on OK
-            self._apply_settings()
+        dialog.exec()
     
-    def _apply_settings(self):
-        """Apply settings changes to UI"""
-        theme = self.theme_manager.get_current_theme()
-        
-        # Update stylesheet
-        QApplication.instance().setStyleSheet(
-            self.theme_manager.get_current_stylesheet()
-        )
-        
-        # Update editor themes and settings
-        self.editor_tabs.set_theme(theme)
-        self.editor_tabs.refresh_settings()
-        
-        # Update terminal theme and settings
-        self.terminal.set_theme(theme)
-        self.terminal._apply_theme()  # Refresh terminal with new font settings
+    def _apply_settings(self, changed: set = SettingsDialog.SETTING_GROUPS):
+        """Apply settings changes to UI, touching only the groups in changed"""
+        if not changed:
+            return
         
-        # Update terminal position
-        self._update_terminal_position()
+        theme = self.theme_manager.get_current_theme()
         
-        # Update theme menu checkmarks
-        current = self.settings.settings.theme.current_theme
-        for name, action in self.theme_actions:
-            action.setChecked(name == current)
+        # Hold repaints until every change is in, then repaint once
+        self.setUpdatesEnabled(False)
+        try:
+            if "theme" in changed:
+                # Update stylesheet
+                self._apply_stylesheet()
+            
+            if changed & {"theme", "editor"}:
+                self.editor_tabs.setUpdatesEnabled(False)
+                try:
+                    if "theme" in changed:
+                        self.editor_tabs.set_theme(theme)
+                    if "editor" in changed:
+                        self.editor_tabs.refresh_settings()
+                finally:
+                    self.editor_tabs.setUpdatesEnabled(True)
+            
+            # Update terminal theme and settings
+            if self.terminal is not None:
+                if "theme" in changed:
+                    self.terminal.set_theme(theme)  # Also re-applies font settings
+                elif "terminal_font" in changed:
+                    self.terminal._apply_theme()
+            
+            if "terminal_position" in changed:
+                self._update_terminal_position()
+            
+            if "theme" in changed:
+                # Update theme menu checkmarks (only the old and new entries change)
+                current = self.settings.settings.theme.current_theme
+                new_action = self._theme_action_by_name.get(current)
+                old_action = self._checked_theme_action
+                if old_action is not None and old_action is not new_action:
+                    with QSignalBlocker(old_action):
+                        old_action.setChecked(False)
+                if new_action is not None:
+                    with QSignalBlocker(new_action):
+                        new_action.setChecked(True)
+                self._checked_theme_action = new_action
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
     
     # View operations
     def _toggle_file_browser(self):
         visible = self.file_browser.isVisible()
         self.file_browser.setVisible(not visible)
         self.settings.settings.window.file_browser_visible = not visible
-        self.settings.save()
+        self._mark_settings_dirty()
         
         self.toggle_browser_action.setChecked(not visible)
         self.browser_toolbar_btn.setChecked(not visible)
     
     def _toggle_terminal(self):
         visible = self.terminal_container.isVisible()
+        if not visible:
+            self._ensure_terminal()
         self.terminal_container.setVisible(not visible)
         self.settings.settings.terminal.visible = not visible
-        self.settings.save()
+        self._mark_settings_dirty()
         
         self.toggle_terminal_action.setChecked(not visible)
         self.terminal_toolbar_btn.setChecked(not visible)
         
         if not visible:
-            self.terminal.focus_input()
+            self._ensure_terminal().focus_input()
     
     def _set_terminal_position(self, position: str):
         self.settings.settings.terminal.position = position
-        self.settings.save()
+        self._mark_settings_dirty()
         self._update_terminal_position()
         
         # Update menu checkmarks
-        for action in self.terminal_position_actions:
-            action.setChecked(action.text().lower() == position)
+        for name, action in self.terminal_position_actions.items():
+            action.setChecked(name == position)
 
     def _open_external_terminal(self):
         """Open an external terminal window in the current directory"""
@@ -820,47 +995,41 @@ class EZIDEMainWindow(QMainWindow):
         if not cwd or not os.path.isdir(cwd):
             cwd = str(Path.home())
             
-        try:
-            if sys.platform == 'win32':
-                # Windows
-                subprocess.Popen(f'start cmd /K "cd /d {cwd}"', shell=True)
-                
-            elif sys.platform == 'darwin':
-                # macOS
-                subprocess.Popen(['open', '-a', 'Terminal', cwd])
-                
-            else:
-                # Linux / Unix
-                self._open_linux_terminal(cwd)
+        error = ""  # Why the launch failed, when the platform says
+        if sys.platform == 'win32':
+            # Windows - QProcess only creates a console when the IDE has none
+            # (it does when started from run.bat), so ask for one explicitly
+            import subprocess
+            try:
+                subprocess.Popen(
+                    ['cmd.exe', '/K'], cwd=cwd,
+                    creationflags=subprocess.CREATE_NEW_CONSOLE
+                )
+                started = True
+            except OSError as e:
+                started = False
+                error = str(e)
+            
+        elif sys.platform == 'darwin':
+            # macOS
+            started, _pid = QProcess.startDetached('open', ['-a', 'Terminal', cwd], cwd)
+            
+        else:
+            # Linux / Unix
+            started = self._open_linux_terminal(cwd)
+            if started is None:
+                return
                 
-        except Exception as e:
+        if not started:
             QMessageBox.critical(
                 self,
                 "Error",
-                f"Failed to launch terminal:\n{str(e)}"
+                f"Failed to launch terminal:\n{error}" if error else "Failed to launch terminal."
             )
 
-    def _open_linux_terminal(self, cwd):
-        """Helper to open Linux terminal"""
-        # Detect available terminal emulator
-        terminals = [
-            'gnome-terminal',
-            'konsole', 
-            'xfce4-terminal',
-            'mate-terminal',
-            'terminator',
-            'xterm',
-            'urxvt',
-            'rxvt',
-            'x-terminal-emulator'
-        ]
-        
-        terminal_cmd = None
-        for term in terminals:
-            if shutil.which(term):
-                terminal_cmd = term
-                break
-        
+    def _open_linux_terminal(self, cwd) -> Optional[bool]:
+        """Helper to open Linux terminal (None if no terminal was found)"""
+        terminal_cmd = _detect_linux_terminal()
         if not terminal_cmd:
             QMessageBox.warning(
                 self, 
@@ -868,40 +1037,39 @@ class EZIDEMainWindow(QMainWindow):
                 "Could not detect a supported external terminal emulator.\n"
                 "Please install gnome-terminal, konsole, xterm, or ensure 'x-terminal-emulator' is configured."
             )
-            return
+            return None
             
         # Construct command based on terminal type
-        if terminal_cmd == 'gnome-terminal':
-            subprocess.Popen([terminal_cmd, '--working-directory', cwd])
+        if terminal_cmd in ('gnome-terminal', 'xfce4-terminal', 'mate-terminal'):
+            args = ['--working-directory', cwd]
         elif terminal_cmd == 'konsole':
-                subprocess.Popen([terminal_cmd, '--workdir', cwd])
-        elif terminal_cmd == 'xfce4-terminal':
-            subprocess.Popen([terminal_cmd, '--working-directory', cwd])
-        elif terminal_cmd == 'mate-terminal':
-            subprocess.Popen([terminal_cmd, '--working-directory', cwd])
+            args = ['--workdir', cwd]
         else:
             # Fallback for xterm and others that don't always support working-dir flags nicely
-            # But usually start in CWD if we pass cwd param to Popen
-            subprocess.Popen([terminal_cmd], cwd=cwd)
+            # But they start in the working directory we launch them from
+            args = []
+            
+        started, _pid = QProcess.startDetached(terminal_cmd, args, cwd)
+        return started
     
     def _zoom_in(self):
-        editor = self.editor_tabs.get_current_editor()
+        editor = self._current_editor
         if editor:
             editor.zoom_in()
     
     def _zoom_out(self):
-        editor = self.editor_tabs.get_current_editor()
+        editor = self._current_editor
         if editor:
             editor.zoom_out()
     
     def _zoom_reset(self):
-        editor = self.editor_tabs.get_current_editor()
+        editor = self._current_editor
         if editor:
             editor.reset_zoom()
     
     def _set_theme(self, theme_name: str):
         self.theme_manager.set_theme(theme_name)
-        self._apply_settings()
+        self._apply_settings({"theme"})
     
     # Run operations
     def _run_current_file(self):
@@ -915,7 +1083,7 @@ class EZIDEMainWindow(QMainWindow):
                 self._toggle_terminal()
             
             # Run in terminal
-            self.terminal.run_ez_file(filepath)
+            self._ensure_terminal().run_ez_file(filepath)
         else:
             self.statusbar.showMessage("No EZ file to run", 3000)
     
@@ -932,9 +1100,9 @@ class EZIDEMainWindow(QMainWindow):
         
         if filepath:
             # Verify it's executable
-            if os.access(filepath, os.X_OK):
+            if _is_executable_file(filepath):
                 self.settings.settings.ez.interpreter_path = filepath
-                self.settings.save()
+                self._mark_settings_dirty()
                 self.statusbar.showMessage(f"EZ interpreter set to: {filepath}", 5000)
             else:
                 QMessageBox.warning(
@@ -948,11 +1116,18 @@ class EZIDEMainWindow(QMainWindow):
             self.file_info_label.setText(filepath)
         else:
             self.file_info_label.setText("Untitled")
-        
-        self._update_recent_files_menu()
     
     def _on_cursor_position_changed(self, line: int, column: int):
-        self.cursor_label.setText(f"Ln {line}, Col {column}")
+        self._pending_cursor = (line, column)
+        if not self._cursor_timer.isActive():
+            self._cursor_timer.start()
+    
+    def _flush_cursor_update(self):
+        """Show the latest cursor position in the status bar"""
+        if self._pending_cursor == self._shown_cursor:
+            return
+        self._shown_cursor = self._pending_cursor
+        self.cursor_label.setText(_cursor_status(*self._pending_cursor))
     
     # Help
     def _show_about(self):
@@ -968,8 +1143,7 @@ class EZIDEMainWindow(QMainWindow):
         )
     
     def _open_docs(self):
-        import webbrowser
-        webbrowser.open("https://schoolyb.github.io/language.ez/docs")
+        QDesktopServices.openUrl(QUrl("https://schoolyb.github.io/language.ez/docs"))
     
     # Window events
     def closeEvent(self, event: QCloseEvent):
@@ -979,57 +1153,92 @@ class EZIDEMainWindow(QMainWindow):
             event.ignore()
             return
         
+        # Read the window and splitter geometry in one go
+        maximized = self.isMaximized()
+        size = self.size()
+        main_sizes = self.main_splitter.sizes()
+        et_sizes = self.editor_terminal_splitter.sizes()
+        
         # Save window state
         ws = self.settings.settings.window
-        ws.maximized = self.isMaximized()
-        if not ws.maximized:
-            ws.width = self.width()
-            ws.height = self.height()
+        ws.maximized = maximized
+        if not maximized:
+            ws.width = size.width()
+            ws.height = size.height()
         
         # Save splitter sizes
-        sizes = self.main_splitter.sizes()
-        if len(sizes) >= 2:
-            ws.file_browser_width = sizes[0]
+        if len(main_sizes) >= 2:
+            ws.file_browser_width = main_sizes[0]
         
-        sizes = self.editor_terminal_splitter.sizes()
-        if len(sizes) >= 2:
+        if len(et_sizes) >= 2:
             if self.settings.settings.terminal.position == "right":
-                ws.terminal_width = sizes[1]
+                ws.terminal_width = et_sizes[1]
             else:
-                ws.terminal_height = sizes[1]
+                ws.terminal_height = et_sizes[1]
         
-        self.settings.save()
+        if self.terminal is not None:
+            self.terminal.shutdown()
+        
+        self._settings_dirty = True
+        self._flush_settings()
+        self._settings_save_pool.waitForDone(2000)
         event.accept()
     
+    def _mark_settings_dirty(self):
+        """Schedule a settings save, coalescing changes made in quick succession"""
+        self._settings_dirty = True
+        self._settings_flush_timer.start()
+    
+    def _flush_settings(self):
+        """Snapshot pending settings changes and write them in the background"""
+        self._settings_flush_timer.stop()
+        if self._settings_dirty:
+            self._settings_dirty = False
+            snapshot = self.settings.snapshot()
+            self._settings_save_pool.start(partial(self.settings.write_snapshot, snapshot))
+    
     # Debug operations
     def _setup_debug(self):
         """Initialize the debug session and connect signals"""
+        import shutil
+        from app.debugger_utils import (
+            detect_debugger_support_cached, get_debugger_display_name, get_debugger_icon
+        )
+        
         # Detect best available debugger
         ez_path = self.settings.settings.ez.interpreter_path
         if not ez_path or not os.path.isfile(ez_path):
             ez_path = shutil.which('ez')
         
-        self.debugger_capabilities = detect_debugger_support(ez_path or '')
+        self.debugger_capabilities = detect_debugger_support_cached(ez_path or '')
+        dtype = self.debugger_capabilities.type
+        dicon = get_debugger_icon(dtype)
+        self._debugger_icon = dicon
+        self._debugger_name = get_debugger_display_name(dtype)
         
         # Create appropriate debug session based on capabilities
-        if self.debugger_capabilities.type == 'native':
+        if dtype == 'native':
+            from app.go_debug_session import GoDebugSession
             self.debug_session = GoDebugSession(self.settings, self)
-            self.statusbar.showMessage(
-                f"{get_debugger_icon('native')} Using Native Debugger", 3000
-            )
+            self.statusbar.showMessage(f"{dicon} Using Native Debugger", 3000)
         else:
+            from app.debug_session import DebugSession
             self.debug_session = DebugSession(self.settings, self)
-            if self.debugger_capabilities.type == 'repl':
-                self.statusbar.showMessage(
-                    f"{get_debugger_icon('repl')} Using REPL Debugger (Limited Features)", 3000
-                )
+            if dtype == 'repl':
+                self.statusbar.showMessage(f"{dicon} Using REPL Debugger (Limited Features)", 3000)
             else:
-                self.statusbar.showMessage(
-                    f"{get_debugger_icon('none')} Debugger not available", 3000
-                )
+                self.statusbar.showMessage(f"{dicon} Debugger not available", 3000)
         
         self._debug_filepath = None  # Track the file being debugged
-        self._debugger_type = self.debugger_capabilities.type
+        self._debug_basename = None
+        
+        # Debuggee output is buffered as (is_error, text) and written to the
+        # panel at most ~30 times a second
+        self._debug_out_buf = []
+        self._debug_out_timer = QTimer(self)
+        self._debug_out_timer.setSingleShot(True)
+        self._debug_out_timer.setInterval(33)
+        self._debug_out_timer.timeout.connect(self._flush_debug_output)
         
         # Connect debug session signals
         self.debug_session.session_started.connect(self._on_debug_started)
@@ -1039,22 +1248,20 @@ class EZIDEMainWindow(QMainWindow):
         self.debug_session.output_received.connect(self._on_debug_output)
         self.debug_session.error_received.connect(self._on_debug_error)
         self.debug_session.ready_for_step.connect(self._on_debug_ready)
-        
-        # Connect debug panel signals
-        self.debug_panel.start_requested.connect(self._debug_start)
-        self.debug_panel.step_requested.connect(self._debug_step)
-        self.debug_panel.stop_requested.connect(self._debug_stop)
-        
-        # Set debugger type indicator in panel
-        debugger_icon = get_debugger_icon(self._debugger_type)
-        debugger_name = get_debugger_display_name(self._debugger_type)
-        self.debug_panel.set_debugger_type(debugger_icon, debugger_name)
     
     def _toggle_debug_panel(self):
         """Toggle visibility of the debug panel"""
-        visible = self.debug_panel.isVisible()
-        self.debug_panel.setVisible(not visible)
-        self.toggle_debug_panel_action.setChecked(not visible)
+        debug_panel = self._ensure_debug_panel()
+        visible = not debug_panel.isVisible()
+        debug_panel.setVisible(visible)
+        self._sync_debug_panel_action(visible)
+    
+    def _sync_debug_panel_action(self, visible: bool):
+        """Match the menu checkmark to the panel without re-emitting toggled"""
+        action = self.toggle_debug_panel_action
+        if action.isChecked() != visible:
+            with QSignalBlocker(action):
+                action.setChecked(visible)
     
     def _debug_start(self):
         """Start debugging the current file"""
@@ -1067,28 +1274,30 @@ class EZIDEMainWindow(QMainWindow):
         self.editor_tabs.save_current()
         
         # Show debug panel
+        self._ensure_debug_panel()
         if not self.debug_panel.isVisible():
             self.debug_panel.show()
-            self.toggle_debug_panel_action.setChecked(True)
+            self._sync_debug_panel_action(True)
         
         # Clear previous debug output for fresh start
+        self._debug_out_buf.clear()
+        self._debug_out_timer.stop()
         self.debug_panel.reset()
         
         # Start the debug session
         self._debug_filepath = filepath
+        self._debug_basename = os.path.basename(filepath)
         working_dir = os.path.dirname(filepath)
         root = getattr(self.file_browser, 'current_root', None)
         if root and os.path.isdir(root):
-            try:
-                root_abs = os.path.abspath(root)
-                file_abs = os.path.abspath(filepath)
-                if os.path.commonpath([root_abs, file_abs]) == root_abs:
-                    working_dir = root_abs
-            except ValueError:
-                pass
+            root_abs = os.path.abspath(root)
+            root_key = os.path.normcase(root_abs)
+            file_key = os.path.normcase(os.path.abspath(filepath))
+            if file_key == root_key or file_key.startswith(root_key.rstrip(os.sep) + os.sep):
+                working_dir = root_abs
 
         if self.debug_session.start(filepath, working_dir=working_dir):
-            self.statusbar.showMessage(f"Debugging: {os.path.basename(filepath)}", 0)
+            self.statusbar.showMessage(f"Debugging: {self._debug_basename}", 0)
     
     def _debug_step(self):
         """Execute next statement"""
@@ -1110,8 +1319,10 @@ class EZIDEMainWindow(QMainWindow):
                 editor.clear_debug_line()
         
         self._debug_filepath = None
+        self._debug_basename = None
         # Just update toolbar, don't reset output so user can see final results
-        self.debug_panel.toolbar.set_debugging(False)
+        if self.debug_panel is not None:
+            self.debug_panel.toolbar.set_debugging(False)
         self.statusbar.showMessage("Debug session ended", 3000)
     
     def _on_debug_started(self):
@@ -1134,7 +1345,8 @@ class EZIDEMainWindow(QMainWindow):
     def _on_debug_ended(self):
         """Handle debug session end"""
         # Just update toolbar state, don't clear output so user can see final results
-        self.debug_panel.toolbar.set_debugging(False)
+        if self.debug_panel is not None:
+            self.debug_panel.toolbar.set_debugging(False)
         self.debug_start_action.setEnabled(True)
         self.debug_step_action.setEnabled(False)
         self.debug_stop_action.setEnabled(False)
@@ -1151,7 +1363,7 @@ class EZIDEMainWindow(QMainWindow):
             editor = self.editor_tabs.get_editor_for_file(self._debug_filepath)
             if editor:
                 editor.set_debug_line(line)
-            self.debug_panel.set_status(f"Line {line}", "#4CAF50")
+            self.debug_panel.set_status(_line_status(line), "#4CAF50")
     
     def _on_debug_variable_updated(self, name: str, value: str):
         """Handle variable value update"""
@@ -1159,13 +1371,36 @@ class EZIDEMainWindow(QMainWindow):
     
     def _on_debug_output(self, text: str):
         """Handle program output during debug"""
-        self.debug_panel.append_output(text)
+        self._queue_debug_output(False, text)
     
     def _on_debug_error(self, message: str):
         """Handle debug error"""
-        self.debug_panel.append_error(message)
+        self._queue_debug_output(True, message)
         self.statusbar.showMessage(f"Debug error: {message}", 5000)
     
+    def _queue_debug_output(self, is_error: bool, text: str):
+        self._debug_out_buf.append((is_error, text))
+        if not self._debug_out_timer.isActive():
+            self._debug_out_timer.start()
+    
+    def _flush_debug_output(self):
+        """Write buffered debug output, merging consecutive program output lines"""
+        buf, self._debug_out_buf = self._debug_out_buf, []
+        if self.debug_panel is None:
+            return
+        
+        pending = []
+        for is_error, text in buf:
+            if is_error:
+                if pending:
+                    self.debug_panel.append_output("\n".join(pending))
+                    pending = []
+                self.debug_panel.append_error(text)
+            else:
+                pending.append(text)
+        if pending:
+            self.debug_panel.append_output("\n".join(pending))
+    
     def _on_debug_ready(self):
         """Handle debug session ready for next step"""
         self.debug_panel.set_step_enabled(True)
@@ -3,13 +3,23 @@ Settings Manager for EZ IDE
 Handles loading and saving configuration from JSON files
 """
 
+import copy
 import json
 import os
+import stat
+import tempfile
+import threading
 from pathlib import Path
 from typing import Any, Optional
 from dataclasses import dataclass, asdict, field
 
 
+# Process umask, read once at import (reading it means setting it, which is
+# not safe once settings are written from a worker thread)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
 def get_config_dir() -> Path:
     """Get the configuration directory for EZ IDE"""
     if os.name == 'nt':  # Windows
@@ -21,6 +31,17 @@ def get_config_dir() -> Path:
     return config_dir
 
 
+def get_cache_dir() -> Path:
+    """Get the cache directory for EZ IDE (safe to delete at any time)"""
+    if os.name == 'nt':  # Windows
+        cache_dir = Path(os.environ.get('LOCALAPPDATA', '')) / 'EZ-IDE' / 'cache'
+    else:  # Linux/macOS
+        cache_dir = Path.home() / '.cache' / 'ez-ide'
+    
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 @dataclass
 class EditorSettings:
     """Editor-specific settings"""
@@ -102,6 +123,12 @@ class SettingsManager:
         self.settings = IDESettings()
         self.keybindings = self._get_default_keybindings()
         
+        # Snapshots are numbered so a slow background write can never
+        # overwrite a newer one that already reached the disk
+        self._snapshot_serial = 0
+        self._written_serial = 0
+        self._write_lock = threading.Lock()
+        
         self.load()
     
     def _get_default_keybindings(self) -> dict:
@@ -198,30 +225,63 @@ class SettingsManager:
     
     def save(self):
         """Save all settings to JSON files"""
-        # Save main settings
-        settings_data = {
-            'editor': asdict(self.settings.editor),
-            'file_browser': asdict(self.settings.file_browser),
-            'terminal': asdict(self.settings.terminal),
-            'window': asdict(self.settings.window),
-            'theme': asdict(self.settings.theme),
-            'ez': asdict(self.settings.ez),
-            'recent_files': self.settings.recent_files,
-            'recent_projects': self.settings.recent_projects,
+        self.write_snapshot(self.snapshot())
+    
+    def snapshot(self) -> dict:
+        """Capture the current settings as plain data for write_snapshot()"""
+        self._snapshot_serial += 1
+        return {
+            'serial': self._snapshot_serial,
+            'settings': {
+                'editor': asdict(self.settings.editor),
+                'file_browser': asdict(self.settings.file_browser),
+                'terminal': asdict(self.settings.terminal),
+                'window': asdict(self.settings.window),
+                'theme': asdict(self.settings.theme),
+                'ez': asdict(self.settings.ez),
+                'recent_files': list(self.settings.recent_files),
+                'recent_projects': list(self.settings.recent_projects),
+            },
+            'keybindings': copy.deepcopy(self.keybindings),
         }
-        
-        try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings_data, f, indent=2)
-        except IOError as e:
-            print(f"Error saving settings: {e}")
-        
-        # Save keybindings
+    
+    def write_snapshot(self, snapshot: dict):
+        """Write a snapshot to disk; safe to call from a worker thread"""
+        with self._write_lock:
+            if snapshot['serial'] <= self._written_serial:
+                return  # A newer snapshot has already been written
+            self._written_serial = snapshot['serial']
+            
+            # Save main settings
+            try:
+                self._write_json(self.settings_file, snapshot['settings'])
+            except IOError as e:
+                print(f"Error saving settings: {e}")
+            
+            # Save keybindings
+            try:
+                self._write_json(self.keybindings_file, snapshot['keybindings'])
+            except IOError as e:
+                print(f"Error saving keybindings: {e}")
+    
+    def _write_json(self, path: Path, data):
+        """Write JSON via a temporary file so readers never see a partial file"""
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=path.parent, prefix=path.name, suffix='.tmp',
+            delete=False
+        ) as f:
+            json.dump(data, f, indent=2)
         try:
-            with open(self.keybindings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.keybindings, f, indent=2)
-        except IOError as e:
-            print(f"Error saving keybindings: {e}")
+            # Temporary files are created 0600; keep the mode the file had
+            try:
+                mode = stat.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(f.name, mode)
+            os.replace(f.name, path)
+        except OSError:
+            os.unlink(f.name)
+            raise
     
     def get_keybinding(self, category: str, action: str) -> str:
         """Get a specific keybinding"""
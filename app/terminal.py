@@ -3,11 +3,13 @@ Terminal Widget for EZ IDE
 Integrated terminal emulator with customizable position
 """
 
+import codecs
+import hashlib
+import json
 import os
 import sys
-import subprocess
 import shutil
-import re
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
@@ -22,10 +24,143 @@ from PyQt6.QtGui import (
     QFont, QColor, QTextCursor, QKeyEvent, QTextCharFormat
 )
 
-from app.settings import SettingsManager
+from app.settings import SettingsManager, get_cache_dir
 from app.themes import Theme
 
 
+def _path_fingerprint() -> str:
+    """Hash of PATH and the modification times of its directories"""
+    digest = hashlib.blake2b(digest_size=8)
+    for directory in os.environ.get('PATH', '').split(os.pathsep):
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except (OSError, ValueError):
+            mtime_ns = 0
+        digest.update(f"{directory}\0{mtime_ns}\0".encode('utf-8', 'surrogateescape'))
+    return digest.hexdigest()
+
+
+def _find_shells() -> list:
+    """Search PATH for the shells the terminal can use"""
+    if sys.platform == 'win32':
+        shells = ['cmd', 'powershell']
+        if shutil.which('wsl'):
+            shells.append('wsl')
+        return shells
+    
+    # Unix-like
+    return [shell for shell in ('bash', 'zsh', 'sh', 'fish') if shutil.which(shell)]
+
+
+def available_shells() -> list:
+    """
+    List the available shells, reusing the last result while PATH is unchanged
+    
+    The cache is keyed on PATH and its directories' modification times, so
+    installing or removing a shell triggers a new search.
+    """
+    fingerprint = _path_fingerprint()
+    cache_file = get_cache_dir() / 'shell_cache.json'
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('path_hash') == fingerprint and isinstance(cache.get('shells'), list):
+            return cache['shells']
+    except (OSError, ValueError, AttributeError):
+        pass
+    
+    shells = _find_shells()
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({'path_hash': fingerprint, 'shells': shells}, f, indent=2)
+    except OSError as e:
+        print(f"Warning: Could not cache shell list: {e}")
+    return shells
+
+
+# Stylesheets for the output view and input line, filled in from the theme and settings
+_OUTPUT_STYLE = """
+    QPlainTextEdit {{
+        background-color: {background};
+        color: {foreground};
+        border: none;
+    }}
+"""
+
+_INPUT_STYLE = """
+    QLineEdit {{
+        background-color: {background};
+        color: {foreground};
+        border: none;
+        font-family: "{font_family}";
+        font-size: {font_size}pt;
+    }}
+"""
+
+
+# Characters allowed in the parameters of an SGR (ESC [ ... m) sequence
+_SGR_PARAM_CHARS = frozenset('0123456789;')
+
+# Escapes that carry a string ended by ST (ESC \): DCS, SOS, PM, APC and OSC
+# (OSC may also end with BEL)
+_STRING_ESCAPES = frozenset('PX^_]')
+
+
+def _scan_escape(text: str, start: int) -> Optional[tuple]:
+    """
+    Scan the escape sequence that starts with the ESC at text[start]
+    
+    Returns:
+        None if the sequence runs past the end of text, otherwise
+        (index after the sequence, list of SGR codes or None for any other
+        sequence, which is simply dropped)
+    """
+    length = len(text)
+    i = start + 1
+    if i >= length:
+        return None
+    kind = text[i]
+    
+    if kind == '[':
+        # CSI: parameter bytes 0x30-0x3F, intermediate bytes 0x20-0x2F,
+        # then a final byte 0x40-0x7E
+        j = i + 1
+        while j < length and '0' <= text[j] <= '?':
+            j += 1
+        params_end = j
+        while j < length and ' ' <= text[j] <= '/':
+            j += 1
+        if j >= length:
+            return None
+        if not '@' <= text[j] <= '~':
+            return j, None  # Malformed - drop what was scanned
+        if text[j] == 'm' and params_end == j:
+            params = text[i + 1:j]
+            if _SGR_PARAM_CHARS.issuperset(params):
+                return j + 1, params.split(';') if params else ['0']
+        return j + 1, None
+    
+    if kind in _STRING_ESCAPES:
+        st = text.find('\x1b\\', i + 1)
+        if kind == ']':
+            bel = text.find('\x07', i + 1, st if st >= 0 else length)
+            if bel >= 0:
+                return bel + 1, None
+        if st < 0:
+            return None
+        return st + 2, None
+    
+    # Anything else: optional intermediate bytes, then one final byte
+    j = i
+    while j < length and ' ' <= text[j] <= '/':
+        j += 1
+    if j >= length:
+        return None
+    if '0' <= text[j] <= '~':
+        return j + 1, None
+    return j, None
+
+
 class TerminalOutput(QPlainTextEdit):
     """Terminal output display widget with ANSI escape code support"""
     
@@ -49,15 +184,22 @@ class TerminalOutput(QPlainTextEdit):
         '97': '#FFFFFF',  # Bright White
     }
     
-    # Regex to match ANSI escape sequences
-    ANSI_ESCAPE_RE = re.compile(r'\x1b\[([0-9;]*)m')
+    # Scrollback limit in lines; when reached, the oldest TRIM_LINES are dropped at once
+    SCROLLBACK_LINES = 10000
+    TRIM_LINES = 1000
+    
+    # Longest cut-off escape sequence kept to be completed by the next append
+    MAX_ESCAPE_TAIL = 4096
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setReadOnly(True)
-        self.setMaximumBlockCount(10000)  # Limit scrollback
+        # Scrollback is limited by trimming in bulk (see _trim_scrollback) rather
+        # than with setMaximumBlockCount, which removes a block on every insert
+        self.document().setUndoRedoEnabled(False)  # Output is never edited
         self._default_format = QTextCharFormat()
         self._current_format = QTextCharFormat()
+        self._escape_tail = ''  # Start of an escape sequence split across appends
         
         # Disable word wrap to preserve preformatted text alignment
         self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
@@ -70,36 +212,93 @@ class TerminalOutput(QPlainTextEdit):
         self.setFont(font)
         self.document().setDefaultFont(font)
     
-    def append_output(self, text: str, color: QColor = None):
-        """Append text to the terminal output, parsing ANSI codes"""
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
+    # Appends longer than this are done with repaints suspended
+    BULK_APPEND_SIZE = 256
+    
+    def append_output(self, text: str, color: QColor = None, fmt: QTextCharFormat = None):
+        """
+        Append text to the terminal output, parsing ANSI codes
         
-        if color:
-            # Direct color override - don't parse ANSI
-            fmt = QTextCharFormat()
-            fmt.setForeground(color)
-            cursor.insertText(text, fmt)
-        else:
-            # Parse ANSI escape codes
-            self._append_with_ansi(cursor, text)
+        Passing a color or a prepared format writes the text as-is in that style.
+        """
+        # Only follow the output if the user has not scrolled back
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
         
-        self.setTextCursor(cursor)
-        self.ensureCursorVisible()
+        bulk = len(text) > self.BULK_APPEND_SIZE
+        if bulk:
+            self.setUpdatesEnabled(False)
+        try:
+            # Insert through a separate cursor so the view and any selection stay put
+            cursor = QTextCursor(self.document())
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            
+            # One edit block per append, so the layout is updated once
+            cursor.beginEditBlock()
+            try:
+                if fmt is not None:
+                    # Direct format override - don't parse ANSI
+                    cursor.insertText(text, fmt)
+                elif color:
+                    # Direct color override - don't parse ANSI
+                    color_fmt = QTextCharFormat()
+                    color_fmt.setForeground(color)
+                    cursor.insertText(text, color_fmt)
+                else:
+                    # Parse ANSI escape codes
+                    self._append_with_ansi(cursor, text)
+            finally:
+                cursor.endEditBlock()
+            
+            if self.document().blockCount() >= self.SCROLLBACK_LINES:
+                self._trim_scrollback()
+            
+            if at_bottom:
+                scrollbar.setValue(scrollbar.maximum())
+        finally:
+            if bulk:
+                self.setUpdatesEnabled(True)
+    
+    def _trim_scrollback(self):
+        """Drop the oldest lines in one pass"""
+        # Setting a block limit trims the document immediately; lifting it
+        # again keeps Qt from trimming on every following insert
+        self.setMaximumBlockCount(self.SCROLLBACK_LINES - self.TRIM_LINES)
+        self.setMaximumBlockCount(0)
     
     def _append_with_ansi(self, cursor: QTextCursor, text: str):
         """Parse and render text with ANSI escape codes"""
+        if self._escape_tail:
+            text = self._escape_tail + text
+            self._escape_tail = ''
+        
+        esc = text.find('\x1b')
+        if esc < 0:
+            # Plain output (the common case) - no scanning needed
+            if text:
+                cursor.insertText(text, self._current_format)
+            return
+        
         pos = 0
-        for match in self.ANSI_ESCAPE_RE.finditer(text):
-            # Insert text before this escape sequence
-            if match.start() > pos:
-                cursor.insertText(text[pos:match.start()], self._current_format)
+        while esc >= 0:
+            scanned = _scan_escape(text, esc)
+            if scanned is None:
+                # Cut off mid-sequence: finish it with the next append (an
+                # unterminated sequence that grows too long is dropped)
+                if len(text) - esc <= self.MAX_ESCAPE_TAIL:
+                    self._escape_tail = text[esc:]
+                text = text[:esc]
+                break
             
-            # Process the escape sequence
-            codes = match.group(1).split(';') if match.group(1) else ['0']
-            self._process_ansi_codes(codes)
+            # Insert text before this escape sequence
+            if esc > pos:
+                cursor.insertText(text[pos:esc], self._current_format)
             
-            pos = match.end()
+            # Apply SGR codes; other sequences (cursor moves, titles, ...) are dropped
+            pos, codes = scanned
+            if codes is not None:
+                self._process_ansi_codes(codes)
+            esc = text.find('\x1b', pos)
         
         # Insert remaining text after last escape sequence
         if pos < len(text):
@@ -107,27 +306,52 @@ class TerminalOutput(QPlainTextEdit):
     
     def _process_ansi_codes(self, codes: list):
         """Process ANSI SGR (Select Graphic Rendition) codes"""
+        colors = self._ANSI_QCOLORS
         for code in codes:
-            if code == '0' or code == '':
+            if code in self._SGR_RESET:
                 # Reset to default
                 self._current_format = QTextCharFormat(self._default_format)
-            elif code == '1':
-                # Bold
-                self._current_format.setFontWeight(700)
-            elif code == '3':
-                # Italic
-                self._current_format.setFontItalic(True)
-            elif code == '4':
-                # Underline
-                self._current_format.setFontUnderline(True)
-            elif code in self.ANSI_COLORS:
+                continue
+            
+            color = colors.get(code)
+            if color is not None:
                 # Foreground color
-                self._current_format.setForeground(QColor(self.ANSI_COLORS[code]))
+                self._current_format.setForeground(color)
+                continue
+            
+            handler = self._SGR_ATTRS.get(code)
+            if handler is not None:
+                handler(self)
+    
+    def _sgr_bold(self):
+        self._current_format.setFontWeight(700)
+    
+    def _sgr_italic(self):
+        self._current_format.setFontItalic(True)
+    
+    def _sgr_underline(self):
+        self._current_format.setFontUnderline(True)
+    
+    # SGR codes by category: reset, colors (_ANSI_QCOLORS), then text attributes
+    _SGR_RESET = frozenset({'0', ''})
+    _SGR_ATTRS = {
+        '1': _sgr_bold,
+        '3': _sgr_italic,
+        '4': _sgr_underline,
+    }
+    
+    # ANSI_COLORS parsed once
+    _ANSI_QCOLORS = {code: QColor(value) for code, value in ANSI_COLORS.items()}
     
     def set_default_color(self, color: QColor):
         """Set the default text color"""
         self._default_format.setForeground(color)
         self._current_format = QTextCharFormat(self._default_format)
+    
+    def reset_ansi_state(self):
+        """Forget any held-back escape and SGR attributes left by earlier output"""
+        self._escape_tail = ''
+        self._current_format = QTextCharFormat(self._default_format)
 
 
 class TerminalInput(QLineEdit):
@@ -166,19 +390,48 @@ class TerminalWidget(QWidget):
     command_executed = pyqtSignal(str)  # command
     directory_changed = pyqtSignal(str)  # new directory
     
+    HISTORY_LIMIT = 5000  # Commands kept in (and saved from) the history
+    
+    # QProcess error code -> message shown in the terminal
+    _PROC_ERR = {
+        QProcess.ProcessError.FailedToStart: "Failed to start",
+        QProcess.ProcessError.Crashed: "Process crashed",
+        QProcess.ProcessError.Timedout: "Process timed out",
+        QProcess.ProcessError.WriteError: "Write error",
+        QProcess.ProcessError.ReadError: "Read error",
+        QProcess.ProcessError.UnknownError: "Unknown error"
+    }
+    
     def __init__(self, settings: SettingsManager, theme: Theme = None, parent=None):
         super().__init__(parent)
         self.settings_manager = settings
         self.theme = theme
         
         self.process: Optional[QProcess] = None
-        self.current_dir = str(Path.home())
-        self.command_history: list = []
-        self.history_index = -1
+        self._home_str = str(Path.home())
+        self._home_prefix = self._home_str.rstrip(os.sep) + os.sep
+        self._last_dir_label: Optional[str] = None
+        self._ez_on_path: Optional[str] = None
+        self.current_dir = self._home_str
+        self.history_file = settings.config_dir / "terminal_history.json"
+        self.command_history: deque = deque(maxlen=self.HISTORY_LIMIT)
+        self._load_history()
+        self.history_index = len(self.command_history)
         
         # Track the currently running command process for interactive input
         self.running_process: Optional[QProcess] = None
         
+        # Process output is collected here and written to the view at most
+        # once per frame; the incremental decoder keeps split UTF-8 sequences intact
+        self._out_buffer = bytearray()
+        self._out_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_output)
+        
+        self._last_style_key: Optional[tuple] = None  # Inputs of the applied stylesheets
+        
         self._setup_ui()
         self._setup_connections()
         self._apply_theme()
@@ -249,17 +502,7 @@ class TerminalWidget(QWidget):
     
     def _populate_shells(self):
         """Populate available shells"""
-        shells = []
-        
-        if sys.platform == 'win32':
-            shells = ['cmd', 'powershell']
-            if shutil.which('wsl'):
-                shells.append('wsl')
-        else:
-            # Unix-like
-            for shell in ['bash', 'zsh', 'sh', 'fish']:
-                if shutil.which(shell):
-                    shells.append(shell)
+        shells = available_shells()
         
         self.shell_combo.addItems(shells)
         
@@ -281,31 +524,49 @@ class TerminalWidget(QWidget):
             from app.themes import DARK_THEME
             self.theme = DARK_THEME
         
-        self.output.setStyleSheet(f"""
-            QPlainTextEdit {{
-                background-color: {self.theme.terminal_background};
-                color: {self.theme.terminal_foreground};
-                border: none;
-            }}
-        """)
+        self._rebuild_color_cache()
+        self.output.set_default_color(self._fg_color)
         
-        # Set font programmatically for proper monospace rendering of Unicode
-        self.output.set_terminal_font(
-            self.settings_manager.settings.terminal.font_family,
-            self.settings_manager.settings.terminal.font_size
+        terminal = self.settings_manager.settings.terminal
+        style_key = (
+            self.theme.terminal_background,
+            self.theme.terminal_foreground,
+            terminal.font_family,
+            terminal.font_size,
         )
+        if style_key == self._last_style_key:
+            return  # Restyling would only force another style pass
+        self._last_style_key = style_key
         
-        self.output.set_default_color(QColor(self.theme.terminal_foreground))
+        background, foreground, font_family, font_size = style_key
+        self.output.setStyleSheet(_OUTPUT_STYLE.format(
+            background=background, foreground=foreground
+        ))
         
-        self.input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {self.theme.terminal_background};
-                color: {self.theme.terminal_foreground};
-                border: none;
-                font-family: "{self.settings_manager.settings.terminal.font_family}";
-                font-size: {self.settings_manager.settings.terminal.font_size}pt;
-            }}
-        """)
+        # Set font programmatically for proper monospace rendering of Unicode
+        self.output.set_terminal_font(font_family, font_size)
+        
+        self.input.setStyleSheet(_INPUT_STYLE.format(
+            background=background, foreground=foreground,
+            font_family=font_family, font_size=font_size
+        ))
+    
+    def _rebuild_color_cache(self):
+        """Build the colors and text formats for terminal messages once per theme"""
+        theme = self.theme
+        self._fg_color = QColor(theme.terminal_foreground)
+        self._fg_format = self._message_format(self._fg_color)
+        self._accent_format = self._message_format(QColor(theme.accent))
+        self._success_format = self._message_format(QColor(theme.success))
+        self._error_format = self._message_format(QColor(theme.error))
+        self._warning_format = self._message_format(QColor(theme.warning))
+        self._info_format = self._message_format(QColor(theme.info))
+    
+    @staticmethod
+    def _message_format(color: QColor) -> QTextCharFormat:
+        fmt = QTextCharFormat()
+        fmt.setForeground(color)
+        return fmt
     
     def set_theme(self, theme: Theme):
         """Update the theme"""
@@ -330,11 +591,12 @@ class TerminalWidget(QWidget):
         # We don't actually start an interactive shell session
         # Instead, we run commands individually
         self.output.append_output(f"Terminal ready. Working directory: {self.current_dir}\n", 
-                                   QColor(self.theme.info))
+                                   fmt=self._info_format)
     
     def _execute_command(self, command: str):
         """Execute a command or send input to running process"""
-        if not command.strip() and not self.running_process:
+        stripped = command.strip()
+        if not stripped and not self.running_process:
             return
         
         # If there's a running process, send input to it instead
@@ -347,39 +609,52 @@ class TerminalWidget(QWidget):
         self.history_index = len(self.command_history)
         
         # Show command in output
-        self.output.append_output(f"$ {command}\n", QColor(self.theme.accent))
+        self._flush_output()
+        self.output.append_output(f"$ {command}\n", fmt=self._accent_format)
         
         # Handle built-in commands
-        if command.strip().startswith('cd '):
-            self._handle_cd(command.strip()[3:].strip())
-            return
-        elif command.strip() == 'cd':
-            self._handle_cd(str(Path.home()))
-            return
-        elif command.strip() == 'clear':
-            self.clear_output()
-            return
-        elif command.strip() == 'pwd':
-            self.output.append_output(f"{self.current_dir}\n")
-            return
+        name, _, arg = stripped.partition(' ')
+        builtin = self._BUILTINS.get(name)
+        if builtin is not None:
+            handler, takes_arg = builtin
+            if takes_arg or not arg:
+                handler(self, arg.strip())
+                return
         
         # Run external command
         self._run_command(command)
     
+    def _builtin_cd(self, arg: str):
+        self._handle_cd(arg or self._home_str)
+    
+    def _builtin_clear(self, arg: str):
+        self.clear_output()
+    
+    def _builtin_pwd(self, arg: str):
+        self.output.append_output(f"{self.current_dir}\n")
+    
+    # Commands handled by the terminal itself: name -> (handler, takes an argument).
+    # The others only match when typed on their own.
+    _BUILTINS = {
+        'cd': (_builtin_cd, True),
+        'clear': (_builtin_clear, False),
+        'pwd': (_builtin_pwd, False),
+    }
+    
     def _send_input_to_process(self, text: str):
         """Send input to the currently running process"""
         if self.running_process and self.running_process.state() == QProcess.ProcessState.Running:
             # Echo the input in the terminal
-            self.output.append_output(f"{text}\n", QColor(self.theme.terminal_foreground))
+            self._flush_output()
+            self.output.append_output(f"{text}\n", fmt=self._fg_format)
             # Send the input with newline to the process stdin
-            input_bytes = (text + "\n").encode('utf-8')
-            self.running_process.write(input_bytes)
+            self.running_process.write(text.encode('utf-8') + b"\n")
     
     def _handle_cd(self, path: str):
         """Handle cd command"""
         # Handle ~ for home directory
         if path.startswith('~'):
-            path = str(Path.home()) + path[1:]
+            path = self._home_str + path[1:]
         
         # Make absolute
         if not os.path.isabs(path):
@@ -392,11 +667,11 @@ class TerminalWidget(QWidget):
             self.current_dir = path
             self._update_dir_label()
             self.output.append_output(f"Changed directory to: {path}\n", 
-                                       QColor(self.theme.success))
+                                       fmt=self._success_format)
             self.directory_changed.emit(path)
         else:
             self.output.append_output(f"Directory not found: {path}\n", 
-                                       QColor(self.theme.error))
+                                       fmt=self._error_format)
     
     def _run_command(self, command: str):
         """Run an external command asynchronously with interactive support"""
@@ -446,12 +721,45 @@ class TerminalWidget(QWidget):
     
     def _on_command_output(self, process: QProcess):
         """Handle command output"""
-        data = process.readAllStandardOutput()
-        text = bytes(data).decode('utf-8', errors='replace')
-        self.output.append_output(text)
+        self._queue_output(process.readAllStandardOutput())
+    
+    def _queue_output(self, data: QByteArray):
+        """Buffer raw process output until the next flush"""
+        # Append through a memoryview: the data is copied once and the buffer stays
+        # a bytearray (a bare "+=" would let QByteArray's own __add__ take over)
+        self._out_buffer += memoryview(data)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_output(self):
+        """Write all buffered process output to the view in one append"""
+        self._flush_timer.stop()
+        if not self._out_buffer:
+            return
+        buf = self._out_buffer
+        if buf.isascii() and not self._out_decoder.getstate()[0]:
+            # Plain ASCII with no partial UTF-8 sequence pending
+            text = buf.decode('ascii')
+        else:
+            text = self._out_decoder.decode(buf)
+        buf.clear()
+        if text:
+            self.output.append_output(text)
+    
+    def _discard_output(self):
+        """Drop buffered output that has not been shown yet"""
+        self._flush_timer.stop()
+        self._out_buffer.clear()
+        self._out_decoder.reset()
+        self.output.reset_ansi_state()
     
     def _on_command_finished(self, exit_code: int, exit_status, process: QProcess = None):
         """Handle command completion"""
+        try:
+            self._flush_output()
+        except RuntimeError:
+            pass
+        
         # Clear the running process if this was it
         if process and process == self.running_process:
             self.running_process = None
@@ -466,42 +774,39 @@ class TerminalWidget(QWidget):
         if exit_code != 0:
             try:
                 self.output.append_output(f"\nProcess exited with code {exit_code}\n",
-                                           QColor(self.theme.warning))
+                                           fmt=self._warning_format)
             except RuntimeError:
                 pass
     
     def _on_output_ready(self):
         """Handle output from shell process"""
         if self.process:
-            data = self.process.readAllStandardOutput()
-            text = bytes(data).decode('utf-8', errors='replace')
-            self.output.append_output(text)
+            self._queue_output(self.process.readAllStandardOutput())
     
     def _on_process_finished(self, exit_code: int, exit_status):
         """Handle shell process finishing"""
+        self._flush_output()
         self.output.append_output(f"\nShell exited with code {exit_code}\n",
-                                   QColor(self.theme.warning))
+                                   fmt=self._warning_format)
     
     def _on_process_error(self, error):
         """Handle process errors"""
-        error_msg = {
-            QProcess.ProcessError.FailedToStart: "Failed to start",
-            QProcess.ProcessError.Crashed: "Process crashed",
-            QProcess.ProcessError.Timedout: "Process timed out",
-            QProcess.ProcessError.WriteError: "Write error",
-            QProcess.ProcessError.ReadError: "Read error",
-            QProcess.ProcessError.UnknownError: "Unknown error"
-        }.get(error, str(error))
+        error_msg = self._PROC_ERR.get(error, str(error))
         
+        self._flush_output()
         self.output.append_output(f"\nProcess error: {error_msg}\n",
-                                   QColor(self.theme.error))
+                                   fmt=self._error_format)
     
     def _update_dir_label(self):
         """Update the directory label"""
-        # Shorten path for display
         path = self.current_dir
-        home = str(Path.home())
-        if path.startswith(home):
+        if path == self._last_dir_label:
+            return
+        self._last_dir_label = path
+        
+        # Shorten path for display
+        home = self._home_str
+        if path == home or path.startswith(self._home_prefix):
             path = "~" + path[len(home):]
         
         # Truncate if too long
@@ -527,6 +832,40 @@ class TerminalWidget(QWidget):
                 self.history_index = len(self.command_history)
                 self.input.clear()
     
+    def _load_history(self):
+        """Load command history saved by a previous session"""
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not load terminal history: {e}")
+            return
+        if isinstance(history, list):
+            self.command_history.extend(c for c in history if isinstance(c, str))
+    
+    def shutdown(self):
+        """Save history and stop any running command before the window closes"""
+        self.save_history()
+        process = self.running_process
+        if process is not None:
+            # The widget is going away, so the exit is not reported
+            process.blockSignals(True)
+            if process.state() != QProcess.ProcessState.NotRunning:
+                process.kill()
+                process.waitForFinished(1000)
+    
+    def save_history(self):
+        """Save command history for the next session"""
+        if not self.command_history:
+            return
+        try:
+            with open(self.history_file, 'w', encoding='utf-8') as f:
+                json.dump(list(self.command_history), f)
+        except OSError as e:
+            print(f"Warning: Could not save terminal history: {e}")
+    
     def _on_shell_changed(self, shell: str):
         """Handle shell selection change"""
         self.settings_manager.settings.terminal.shell = shell
@@ -538,9 +877,10 @@ class TerminalWidget(QWidget):
         """Clear the terminal output"""
         # Kill any running process and reset prompt
         self._stop_running_process()
+        self._discard_output()
         self.output.clear()
         self.output.append_output(f"Terminal ready. Working directory: {self.current_dir}\n",
-                                   QColor(self.theme.info))
+                                   fmt=self._info_format)
     
     def restart_shell(self):
         """Restart the shell"""
@@ -554,6 +894,8 @@ class TerminalWidget(QWidget):
         if self.running_process and self.running_process.state() == QProcess.ProcessState.Running:
             self.running_process.kill()
             self.running_process.waitForFinished(1000)
+            # A killed command may stop mid-sequence; don't carry that into the next one
+            self.output.reset_ansi_state()
         self.running_process = None
         # Reset prompt back to normal
         try:
@@ -569,7 +911,7 @@ class TerminalWidget(QWidget):
             self.current_dir = path
             self._update_dir_label()
             self.output.append_output(f"Working directory: {path}\n",
-                                       QColor(self.theme.info))
+                                       fmt=self._info_format)
     
     def _get_ez_interpreter(self) -> Optional[str]:
         """Get the EZ interpreter path from settings or PATH"""
@@ -578,8 +920,10 @@ class TerminalWidget(QWidget):
         if configured and os.path.isfile(configured) and os.access(configured, os.X_OK):
             return configured
         
-        # Fall back to PATH
-        return shutil.which('ez')
+        # Fall back to PATH (a miss is retried, in case EZ gets installed)
+        if self._ez_on_path is None:
+            self._ez_on_path = shutil.which('ez')
+        return self._ez_on_path
     
     def run_ez_file(self, filepath: str):
         """Run an EZ file"""
@@ -592,7 +936,7 @@ class TerminalWidget(QWidget):
                 "Error: EZ interpreter not found.\n"
                 "Configure via: Run > Select EZ Interpreter\n"
                 "Or install EZ: make install (from project root)\n",
-                QColor(self.theme.error)
+                fmt=self._error_format
             )
             return
         
@@ -33,10 +33,9 @@ def main():
     # Load settings
     settings = SettingsManager()
     
-    # Apply theme
+    # Load themes (the main window applies the stylesheet to itself)
     from app.themes import ThemeManager
     theme_manager = ThemeManager(settings)
-    app.setStyleSheet(theme_manager.get_current_stylesheet())
     
     # Create and show main window
     window = EZIDEMainWindow(settings, theme_manager)